@@ -24,8 +24,9 @@
 
 import os
 import re
-import time
-from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+from io import StringIO
 
 from nipype.interfaces.base import (
     BaseInterfaceInputSpec,
@@ -39,16 +40,6 @@ from nipype.interfaces.base import (
     traits,
 )
 
-SUBJECT_TEMPLATE = """\
-\t<ul class="elem-desc">
-\t\t<li>Subject ID: {subject_id}</li>
-\t\t<li>Functional series: {n_bold:d}</li>
-{tasks}
-\t\t<li>Standard output spaces: {std_spaces}</li>
-\t\t<li>Non-standard output spaces: {nstd_spaces}</li>
-\t</ul>
-"""
-
 FUNCTIONAL_TEMPLATE = """\
 \t\t<details open>
 \t\t<summary>Summary</summary>
@@ -64,13 +55,36 @@ FUNCTIONAL_TEMPLATE = """\
 \t\t</details>
 """
 
-ABOUT_TEMPLATE = """\t<ul>
-\t\t<li>fMRIPost-AROMA version: {version}</li>
-\t\t<li>fMRIPost-AROMA command: <code>{command}</code></li>
-\t\t<li>Date postprocessed: {date}</li>
-\t</ul>
-</div>
-"""
+_BIDS_NAME_RE = re.compile(
+    r'^(.*\/)?'
+    '(?P<subject_id>sub-[a-zA-Z0-9]+)'
+    '(_(?P<session_id>ses-[a-zA-Z0-9]+))?'
+    '(_task-(?P<task_id>[a-zA-Z0-9]+))?'
+    '(_(?P<acq_id>acq-[a-zA-Z0-9]+))?'
+    '(_(?P<rec_id>rec-[a-zA-Z0-9]+))?'
+    '(_(?P<run_id>run-[a-zA-Z0-9]+))?',
+    re.MULTILINE,
+)
+
+
+@lru_cache(maxsize=None)
+def _task_counts(bold_series):
+    """Count runs per task in a tuple of BOLD series, as sorted ``(task_id, n_runs)`` pairs."""
+    # One match per line, as the pattern is anchored to the start of each line
+    counts = {}
+    for m in _BIDS_NAME_RE.finditer('\n'.join(bold_series)):
+        task_id = m.group('task_id')
+        if task_id:
+            counts[task_id] = counts.get(task_id, 0) + 1
+    return tuple(sorted(counts.items()))
+
+
+@lru_cache(maxsize=1)
+def _plot_melodic_components():
+    """Import niworkflows' MELODIC plotter on first use only."""
+    from niworkflows.viz.utils import plot_melodic_components
+
+    return plot_melodic_components
 
 
 class SummaryOutputSpec(TraitedSpec):
@@ -83,7 +97,7 @@ class SummaryInterface(SimpleInterface):
     def _run_interface(self, runtime):
         segment = self._generate_segment()
         fname = os.path.join(runtime.cwd, 'report.html')
-        with open(fname, 'w') as fobj:
+        with open(fname, 'w', buffering=1 << 16) as fobj:
             fobj.write(segment)
         self._results['out_report'] = fname
         return runtime
@@ -107,43 +121,33 @@ class SubjectSummary(SummaryInterface):
     output_spec = SummaryOutputSpec
 
     def _generate_segment(self):
-        BIDS_NAME = re.compile(
-            r'^(.*\/)?'
-            '(?P<subject_id>sub-[a-zA-Z0-9]+)'
-            '(_(?P<session_id>ses-[a-zA-Z0-9]+))?'
-            '(_(?P<task_id>task-[a-zA-Z0-9]+))?'
-            '(_(?P<acq_id>acq-[a-zA-Z0-9]+))?'
-            '(_(?P<rec_id>rec-[a-zA-Z0-9]+))?'
-            '(_(?P<run_id>run-[a-zA-Z0-9]+))?'
-        )
-
         # Add list of tasks with number of runs
-        bold_series = self.inputs.bold if isdefined(self.inputs.bold) else []
-        bold_series = [s[0] if isinstance(s, list) else s for s in bold_series]
+        bold_series = ()
+        if isdefined(self.inputs.bold):
+            # Nested traits lists are TraitListObject instances, so keep isinstance here
+            bold_series = tuple(s[0] if isinstance(s, list) else s for s in self.inputs.bold)
 
-        counts = Counter(
-            BIDS_NAME.search(series).groupdict()['task_id'][5:] for series in bold_series
-        )
+        counts = _task_counts(bold_series)
 
-        tasks = ''
+        out = StringIO()
+        out.write('\t<ul class="elem-desc">\n')
+        out.write(f'\t\t<li>Subject ID: {self.inputs.subject_id}</li>\n')
+        out.write(f'\t\t<li>Functional series: {len(bold_series):d}</li>\n')
         if counts:
-            header = '\t\t<ul class="elem-desc">'
-            footer = '\t\t</ul>'
-            lines = [
-                '\t\t\t<li>Task: {task_id} ({n_runs:d} run{s})</li>'.format(
-                    task_id=task_id, n_runs=n_runs, s='' if n_runs == 1 else 's'
-                )
-                for task_id, n_runs in sorted(counts.items())
-            ]
-            tasks = '\n'.join([header] + lines + [footer])
-
-        return SUBJECT_TEMPLATE.format(
-            subject_id=self.inputs.subject_id,
-            n_bold=len(bold_series),
-            tasks=tasks,
-            std_spaces=', '.join(self.inputs.std_spaces),
-            nstd_spaces=', '.join(self.inputs.nstd_spaces),
-        )
+            out.write('\t\t<ul class="elem-desc">\n')
+            for task_id, n_runs in counts:
+                s = '' if n_runs == 1 else 's'
+                out.write(f'\t\t\t<li>Task: {task_id} ({n_runs:d} run{s})</li>\n')
+            out.write('\t\t</ul>')
+        out.write('\n')
+        out.write('\t\t<li>Standard output spaces: ')
+        out.write(', '.join(self.inputs.std_spaces))
+        out.write('</li>\n')
+        out.write('\t\t<li>Non-standard output spaces: ')
+        out.write(', '.join(self.inputs.nstd_spaces))
+        out.write('</li>\n')
+        out.write('\t</ul>\n')
+        return out.getvalue()
 
 
 class AboutSummaryInputSpec(BaseInterfaceInputSpec):
@@ -156,10 +160,14 @@ class AboutSummary(SummaryInterface):
     input_spec = AboutSummaryInputSpec
 
     def _generate_segment(self):
-        return ABOUT_TEMPLATE.format(
-            version=self.inputs.version,
-            command=self.inputs.command,
-            date=time.strftime('%Y-%m-%d %H:%M:%S %z'),
+        date = datetime.now().astimezone().isoformat(sep=' ', timespec='seconds')
+        return (
+            '\t<ul>\n'
+            f'\t\t<li>fMRIPost-AROMA version: {self.inputs.version}</li>\n'
+            f'\t\t<li>fMRIPost-AROMA command: <code>{self.inputs.command}</code></li>\n'
+            f'\t\t<li>Date postprocessed: {date}</li>\n'
+            '\t</ul>\n'
+            '</div>\n'
         )
 
 
@@ -212,11 +220,11 @@ class ICAAROMARPT(SimpleInterface):
     output_spec = _ICAAROMAOutputSpecRPT
 
     def _run_interface(self, runtime):
-        from niworkflows.viz.utils import plot_melodic_components
-
-        out_file = os.path.abspath(self.inputs.out_report)
+        out_file = self.inputs.out_report
+        if not os.path.isabs(out_file):
+            out_file = os.path.join(runtime.cwd, out_file)
 
-        plot_melodic_components(
+        _plot_melodic_components()(
             melodic_dir=self.inputs.melodic_dir,
             in_file=self.inputs.in_file,
             out_file=out_file,
@@ -258,7 +266,9 @@ class ICAAROMAMetricsRPT(SimpleInterface):
         import pandas as pd
         import seaborn as sns
 
-        out_file = os.path.abspath(self.inputs.out_report)
+        out_file = self.inputs.out_report
+        if not os.path.isabs(out_file):
+            out_file = os.path.join(runtime.cwd, out_file)
 
         df = pd.read_table(self.inputs.aroma_features)
 
@@ -0,0 +1,23 @@
+"""Lightweight tests for fmripost_aroma.interfaces.reportlets."""
+
+from fmripost_aroma.interfaces.reportlets import _task_counts
+
+
+def test_task_counts():
+    """Test _task_counts with a mix of well-formed and incomplete BOLD names."""
+    bold_series = (
+        '/data/sub-01/func/sub-01_task-rest_run-1_bold.nii.gz',
+        '/data/sub-01/func/sub-01_task-rest_run-2_bold.nii.gz',
+        '/data/sub-01/ses-1/func/sub-01_ses-1_task-nback_acq-mb_bold.nii.gz',
+        # No task entity: counted as a series, but not listed as a task
+        '/data/sub-01/func/sub-01_run-1_bold.nii.gz',
+        # No subject entity: not matched at all
+        '/data/func/task-rest_bold.nii.gz',
+    )
+    # Task labels are captured without the "task-" prefix
+    assert _task_counts(bold_series) == (('nback', 1), ('rest', 2))
+
+
+def test_task_counts_empty():
+    """Test _task_counts without any BOLD series."""
+    assert _task_counts(()) == ()